@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import equinox as eqx
+import jax
 import jax.numpy as jnp
+import numpy as np
 from jax import Array
+from jaxtyping import ArrayLike
 
 from .qarrays.qarray import QArray
 
@@ -66,7 +69,7 @@ def check_shape(
     )
 
 
-def check_times(x: Array, argname: str, allow_empty: bool = False) -> Array:
+def check_times(x: ArrayLike, argname: str, allow_empty: bool = False) -> Array:
     # check that an array of time is valid (it must be a 1D array sorted in strictly
     # ascending order)
 
@@ -75,6 +78,11 @@ def check_times(x: Array, argname: str, allow_empty: bool = False) -> Array:
     # code elimination, see https://docs.kidger.site/equinox/api/errors/ for more
     # details
 
+    # concrete host inputs (e.g. NumPy arrays or lists of floats) are checked with
+    # NumPy, to avoid dispatching the checks to the device
+    is_host = _is_host_array(x)
+    x = np.asarray(x) if is_host else jnp.asarray(x)
+
     if x.ndim != 1:
         raise ValueError(
             f'Argument {argname} must be a 1D array, but is a {x.ndim}D array.'
@@ -82,6 +90,13 @@ def check_times(x: Array, argname: str, allow_empty: bool = False) -> Array:
     if not allow_empty and len(x) == 0:
         raise ValueError(f'Argument {argname} must contain at least one element.')
 
+    if is_host:
+        if np.any(x[1:] < x[:-1]):
+            raise ValueError(
+                f'Argument {argname} must be sorted in strictly ascending order.'
+            )
+        return jnp.asarray(x)
+
     # this check is written to be JIT-compatible
     return eqx.error_if(
         x,
@@ -90,6 +105,13 @@ def check_times(x: Array, argname: str, allow_empty: bool = False) -> Array:
     )
 
 
+def _is_host_array(x: ArrayLike) -> bool:
+    # returns True if `x` is a NumPy array, a NumPy or Python scalar, or a nested
+    # sequence of those
+    host_types = np.ndarray | np.generic | int | float
+    return all(isinstance(leaf, host_types) for leaf in jax.tree.leaves(x))
+
+
 def check_type_int(x: Array | QArray, argname: str):
     if not jnp.issubdtype(x.dtype, jnp.integer):
         raise ValueError(
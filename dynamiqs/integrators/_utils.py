@@ -10,8 +10,8 @@ from jaxtyping import PyTree
 
 from .._utils import obj_type_str
 from ..method import Method, _DEAdaptiveStep
-from ..qarrays.qarray import QArrayLike
-from ..qarrays.utils import asqarray
+from ..qarrays.qarray import QArray, QArrayLike
+from ..qarrays.utils import asqarray, stack
 from ..time_qarray import (
     ConstantTimeQArray,
     PWCTimeQArray,
@@ -35,6 +35,47 @@ def astimeqarray(x: QArrayLike | TimeQArray) -> TimeQArray:
             ) from e
 
 
+def stack_qarrays(x: Sequence[QArray]) -> QArray:
+    # stack qarrays of identical shape and dims along a new leading axis, the qarrays
+    # are converted to dense if they don't all share the same layout
+    if len({q.layout for q in x}) > 1:
+        x = [q.asdense() for q in x]
+    return stack(x)
+
+
+def broadcast_batch(
+    x: QArray | TimeQArray, in_axes: PyTree[int | None], bshape: tuple[int, ...]
+) -> tuple[QArray | TimeQArray, PyTree[int | None]]:
+    # broadcast the batch dimensions of `x` to `bshape` and return it with its
+    # `in_axes`, except if `x` has no batch dimension in which case it is returned as
+    # is with `in_axes=None`, to avoid materializing and vectorizing over copies
+    if x.ndim == 2:
+        return x, None
+    if x.shape[:-2] != bshape:
+        x = x.broadcast_to(*bshape, *x.shape[-2:])
+    return x, in_axes
+
+
+def broadcast_batch_list(
+    xs: list[QArray | TimeQArray],
+    in_axes: list[PyTree[int | None]],
+    bshape: tuple[int, ...],
+) -> tuple[list[QArray | TimeQArray], list[PyTree[int | None]]]:
+    # same as `broadcast_batch` for a list of qarrays or time-qarrays
+    res = [broadcast_batch(x, ax, bshape) for x, ax in zip(xs, in_axes, strict=True)]
+    return [x for x, _ in res], [ax for _, ax in res]
+
+
+def isconstant(x: TimeQArray) -> bool:
+    # check if a time-qarray is constant, or a sum of constant time-qarrays
+    if isinstance(x, ConstantTimeQArray):
+        return True
+    elif isinstance(x, SummedTimeQArray):
+        return all(isconstant(timeqarray) for timeqarray in x.timeqarrays)
+    else:
+        return False
+
+
 def ispwc(x: TimeQArray) -> bool:
     # check if a time-qarray is constant or piecewise constant
     if isinstance(x, ConstantTimeQArray | PWCTimeQArray):
@@ -148,6 +189,10 @@ def cartesian_vmap(
     `in_axes` is not `None` must be broadcasted to the same shape before calling the
     returned function.
 
+    The batch dimensions of each input are flattened into a single axis, such that `f`
+    is vmapped only once per input, and the corresponding output dimensions are then
+    unflattened.
+
     Args:
         in_axes: Same as `in_axes` of `jax.vmap`.
         out_axes: Same as `out_axes` of `jax.vmap`.
@@ -169,16 +214,56 @@ def cartesian_vmap(
         (3, 4, 5, 6, 7, 2, 2)
     """
     keyleaf = jax.tree_util.tree_leaves_with_path(nvmap)
+    keyleaf = [(path, n) for path, n in keyleaf if n > 0]
 
-    # apply successive vmaps in reverse order
-    for path, n in keyleaf[::-1]:
-        if n > 0:
-            # set all elements `in_axes` to `None` except for a specific subpart
-            keep_path_only = lambda cpath, x, path=path: (
-                x if cpath[: len(path)] == path else None
+    # set all elements `in_axes` to `None` except for a specific subpart
+    def keep_path_only(path: tuple) -> PyTree[int | None]:
+        return jax.tree_util.tree_map_with_path(
+            lambda cpath, x: x if cpath[: len(path)] == path else None, in_axes
+        )
+
+    in_axes_singles = [keep_path_only(path) for path, _ in keyleaf]
+
+    # apply successive vmaps in reverse order, once per vectorized subpart
+    vf = f
+    for in_axes_single in in_axes_singles[::-1]:
+        vf = jax.vmap(vf, in_axes=in_axes_single, out_axes=out_axes)
+
+    def map_vectorized(fn: callable, axes: PyTree[int | None], tree: PyTree) -> PyTree:
+        # apply `fn` to all leaves of `tree` which are vectorized according to `axes`
+        return jax.tree.map(
+            lambda axis, subtree: (
+                subtree if axis is None else jax.tree.map(fn, subtree)
+            ),
+            axes,
+            tree,
+            is_leaf=lambda x: x is None,
+        )
+
+    @wraps(f)
+    def wrapper(*args):  # noqa: ANN202
+        # flatten the batch dimensions of each vectorized subpart into a single axis
+        bshape = ()
+        for in_axes_single, (_, n) in zip(in_axes_singles, keyleaf, strict=True):
+            leaves = jax.tree.leaves(
+                jax.tree.map(
+                    lambda axis, subtree: None if axis is None else subtree,
+                    in_axes_single,
+                    args,
+                    is_leaf=lambda x: x is None,
+                )
+            )
+            bshape += leaves[0].shape[:n]
+            args = map_vectorized(
+                lambda x, n=n: x.reshape(-1, *x.shape[n:]), in_axes_single, args
             )
-            in_axes_single = jax.tree_util.tree_map_with_path(keep_path_only, in_axes)
-            for _ in range(n):
-                f = jax.vmap(f, in_axes=in_axes_single, out_axes=out_axes)
 
-    return f
+        out = vf(*args)
+
+        # unflatten the batch dimensions of the output
+        nflat = len(keyleaf)
+        return map_vectorized(
+            lambda x: x.reshape(*bshape, *x.shape[nflat:]), out_axes, out
+        )
+
+    return wrapper
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Callable
 from functools import partial
 
 import jax
@@ -19,10 +20,13 @@ from ...time_qarray import TimeQArray
 from .._utils import (
     assert_method_supported,
     astimeqarray,
+    broadcast_batch,
     cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
+    stack_qarrays,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.fixed_step_stochastic_integrator import (
     dsmesolve_euler_maruyama_integrator_constructor,
     dsmesolve_rouchon1_integrator_constructor,
@@ -234,7 +238,6 @@ def dsmesolve(
     Ls = [astimeqarray(L) for L in jump_ops]
     etas = jnp.asarray(etas)
     rho0 = asqarray(rho0)
-    tsave = jnp.asarray(tsave)
     keys = jnp.asarray(keys)
     if exp_ops is not None:
         exp_ops = [asqarray(E) for E in exp_ops] if len(exp_ops) > 0 else None
@@ -244,9 +247,24 @@ def dsmesolve(
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'dsmesolve')
 
+    # stack exp_ops into a single qarray of shape (nE, n, n)
+    if exp_ops is not None:
+        exp_ops = stack_qarrays(exp_ops)
+
     if method is None:
         raise ValueError('Argument `method` must be specified.')
 
+    # === select integrator constructor
+    integrator_constructors = {
+        EulerMaruyama: dsmesolve_euler_maruyama_integrator_constructor,
+        Rouchon1: dsmesolve_rouchon1_integrator_constructor,
+    }
+    assert_method_supported(method, integrator_constructors.keys())
+    integrator_constructor = integrator_constructors[type(method)]
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
     # === convert rho0 to density matrix
     rho0 = rho0.todm()
     rho0 = check_hermitian(rho0, 'rho0')
@@ -261,12 +279,32 @@ def dsmesolve(
     # objects (which are not JIT-compatible) to JAX arrays
     tsave = tuple(tsave.tolist())  # todo: fix static tsave
     return _vectorized_dsmesolve(
-        H, Lcs, Lms, etas, rho0, tsave, keys, exp_ops, method, gradient, options
+        H,
+        Lcs,
+        Lms,
+        etas,
+        rho0,
+        tsave,
+        keys,
+        exp_ops,
+        integrator_constructor,
+        method,
+        gradient,
+        options,
     )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('tsave', 'method', 'gradient', 'options'))
+@partial(
+    jax.jit,
+    static_argnames=(
+        'tsave',
+        'integrator_constructor',
+        'method',
+        'gradient',
+        'options',
+    ),
+)
 def _vectorized_dsmesolve(
     H: TimeQArray,
     Lcs: list[TimeQArray],
@@ -275,7 +313,8 @@ def _vectorized_dsmesolve(
     rho0: QArray,
     tsave: Array,
     keys: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
@@ -284,30 +323,43 @@ def _vectorized_dsmesolve(
 
     # === vectorize function over stochastic trajectories
     # the input is vectorized over `key`
-    in_axes = (None, None, None, None, None, None, 0, None, None, None, None)
+    in_axes = (*(None,) * 6, 0, *(None,) * 5)
     # the result is vectorized over `_saved`, `infos` and `keys`
     out_axes = DSMESolveResult.out_axes()
     f = jax.vmap(f, in_axes, out_axes)
 
     # === vectorize function
     # vectorize input over H and rho0
-    in_axes = (H.in_axes, None, None, None, 0, None, None, None, None, None, None)
+    in_axes = (H.in_axes, None, None, None, 0, *(None,) * 7)
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, 0, 0, 0, rho0.ndim - 2, 0, 0, 0, 0, 0, 0)
+        nvmap = (H.ndim - 2, 0, 0, 0, rho0.ndim - 2, *(0,) * 7)
         f = cartesian_vmap(f, in_axes, out_axes, nvmap)
     else:
         bshape = jnp.broadcast_shapes(H.shape[:-2], rho0.shape[:-2])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        n = H.shape[-1]
-        H = H.broadcast_to(*bshape, n, n)
-        rho0 = rho0.broadcast_to(*bshape, n, n)
+        H, H_in_axes = broadcast_batch(H, in_axes[0], bshape)
+        rho0, rho0_in_axes = broadcast_batch(rho0, in_axes[4], bshape)
+        in_axes = (H_in_axes, *in_axes[1:4], rho0_in_axes, *in_axes[5:])
         # vectorize the function
         f = multi_vmap(f, in_axes, out_axes, nvmap)
 
     # === apply vectorized function
-    return f(H, Lcs, Lms, etas, rho0, tsave, keys, exp_ops, method, gradient, options)
+    return f(
+        H,
+        Lcs,
+        Lms,
+        etas,
+        rho0,
+        tsave,
+        keys,
+        exp_ops,
+        integrator_constructor,
+        method,
+        gradient,
+        options,
+    )
 
 
 def _dsmesolve_single_trajectory(
@@ -318,22 +370,12 @@ def _dsmesolve_single_trajectory(
     rho0: QArray,
     tsave: Array,
     key: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> DSMESolveResult:
-    # === select integrator constructor
-    integrator_constructors = {
-        EulerMaruyama: dsmesolve_euler_maruyama_integrator_constructor,
-        Rouchon1: dsmesolve_rouchon1_integrator_constructor,
-    }
-    assert_method_supported(method, integrator_constructors.keys())
-    integrator_constructor = integrator_constructors[type(method)]
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from functools import partial
 
 import jax
@@ -19,10 +20,13 @@ from ...time_qarray import TimeQArray
 from .._utils import (
     assert_method_supported,
     astimeqarray,
+    broadcast_batch,
     cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
+    stack_qarrays,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.fixed_step_stochastic_integrator import (
     dssesolve_euler_maruyama_integrator_constructor,
 )
@@ -226,7 +230,6 @@ def dssesolve(
     H = astimeqarray(H)
     Ls = [astimeqarray(L) for L in jump_ops]
     psi0 = asqarray(psi0)
-    tsave = jnp.asarray(tsave)
     keys = jnp.asarray(keys)
     if exp_ops is not None:
         exp_ops = [asqarray(E) for E in exp_ops] if len(exp_ops) > 0 else None
@@ -236,26 +239,59 @@ def dssesolve(
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'dssesolve')
 
+    # stack exp_ops into a single qarray of shape (nE, n, n)
+    if exp_ops is not None:
+        exp_ops = stack_qarrays(exp_ops)
+
     if method is None:
         raise ValueError('Argument `method` must be specified.')
 
+    # === select integrator constructor
+    integrator_constructors = {
+        EulerMaruyama: dssesolve_euler_maruyama_integrator_constructor
+    }
+    assert_method_supported(method, integrator_constructors.keys())
+    integrator_constructor = integrator_constructors[type(method)]
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
     # we implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to JAX arrays
     tsave = tuple(tsave.tolist())  # todo: fix static tsave
     return _vectorized_dssesolve(
-        H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options
+        H,
+        Ls,
+        psi0,
+        tsave,
+        keys,
+        exp_ops,
+        integrator_constructor,
+        method,
+        gradient,
+        options,
     )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('tsave', 'method', 'gradient', 'options'))
+@partial(
+    jax.jit,
+    static_argnames=(
+        'tsave',
+        'integrator_constructor',
+        'method',
+        'gradient',
+        'options',
+    ),
+)
 def _vectorized_dssesolve(
     H: TimeQArray,
     Ls: list[TimeQArray],
     psi0: QArray,
     tsave: Array,
     keys: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
@@ -264,30 +300,41 @@ def _vectorized_dssesolve(
 
     # === vectorize function over stochastic trajectories
     # the input is vectorized over `key`
-    in_axes = (None, None, None, None, 0, None, None, None, None)
+    in_axes = (None, None, None, None, 0, *(None,) * 5)
     # the result is vectorized over `_saved`, `infos` and `keys`
     out_axes = DSSESolveResult.out_axes()
     f = jax.vmap(f, in_axes, out_axes)
 
     # === vectorize function
     # vectorize input over H and psi0
-    in_axes = (H.in_axes, None, 0, None, None, None, None, None, None)
+    in_axes = (H.in_axes, None, 0, *(None,) * 7)
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, 0, psi0.ndim - 2, 0, 0, 0, 0, 0, 0)
+        nvmap = (H.ndim - 2, 0, psi0.ndim - 2, *(0,) * 7)
         f = cartesian_vmap(f, in_axes, out_axes, nvmap)
     else:
-        n = H.shape[-1]
         bshape = jnp.broadcast_shapes(H.shape[:-2], psi0.shape[:-2])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        H = H.broadcast_to(*bshape, n, n)
-        psi0 = psi0.broadcast_to(*bshape, n, 1)
+        H, H_in_axes = broadcast_batch(H, in_axes[0], bshape)
+        psi0, psi0_in_axes = broadcast_batch(psi0, in_axes[2], bshape)
+        in_axes = (H_in_axes, in_axes[1], psi0_in_axes, *in_axes[3:])
         # vectorize the function
         f = multi_vmap(f, in_axes, out_axes, nvmap)
 
     # === apply vectorized function
-    return f(H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options)
+    return f(
+        H,
+        Ls,
+        psi0,
+        tsave,
+        keys,
+        exp_ops,
+        integrator_constructor,
+        method,
+        gradient,
+        options,
+    )
 
 
 def _dssesolve_single_trajectory(
@@ -296,21 +343,12 @@ def _dssesolve_single_trajectory(
     psi0: QArray,
     tsave: Array,
     key: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> DSSESolveResult:
-    # === select integrator constructor
-    integrator_constructors = {
-        EulerMaruyama: dssesolve_euler_maruyama_integrator_constructor
-    }
-    assert_method_supported(method, integrator_constructors.keys())
-    integrator_constructor = integrator_constructors[type(method)]
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
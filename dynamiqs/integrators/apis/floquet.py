@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from functools import partial
 
 import equinox as eqx
@@ -11,15 +12,18 @@ from ..._checks import check_shape, check_times
 from ...gradient import Gradient
 from ...method import Dopri5, Dopri8, Euler, Kvaerno3, Kvaerno5, Method, Tsit5
 from ...options import Options, check_options
-from ...qarrays.qarray import QArrayLike
+from ...qarrays.layout import dense
+from ...qarrays.qarray import QArray, QArrayLike
 from ...result import FloquetResult
-from ...time_qarray import TimeQArray
+from ...time_qarray import ConstantTimeQArray, TimeQArray
+from ...utils.operators import eye
 from .._utils import (
     assert_method_supported,
     astimeqarray,
     cartesian_vmap,
     catch_xla_runtime_error,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.floquet_integrator import floquet_integrator_constructor
 
 __all__ = ['floquet']
@@ -153,59 +157,68 @@ def floquet(
     """
     # === convert arguments
     H = astimeqarray(H)
-    tsave = jnp.asarray(tsave)
 
     # === check arguments
     tsave = check_times(tsave, 'tsave')
     H, T, tsave = _check_floquet_args(H, T, tsave)
     check_options(options, 'floquet')
 
+    # === select integrator constructor
+    supported_methods = (Tsit5, Dopri5, Dopri8, Kvaerno3, Kvaerno5, Euler)
+    assert_method_supported(method, supported_methods)
+    integrator_constructor = floquet_integrator_constructor
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
     # We implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to qarrays
-    return _vectorized_floquet(H, T, tsave, method, gradient, options)
+    return _vectorized_floquet(
+        H, T, tsave, integrator_constructor, method, gradient, options
+    )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('method', 'gradient', 'options'))
+@partial(
+    jax.jit, static_argnames=('integrator_constructor', 'method', 'gradient', 'options')
+)
 def _vectorized_floquet(
     H: TimeQArray,
     T: float,
     tsave: Array,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient,
     options: Options,
 ) -> FloquetResult:
+    # initial propagator, shared by all batched Hamiltonians
+    y0 = eye(*H.dims, layout=dense)
+
     # vectorize input over H
-    in_axes = (H.in_axes, None, None, None, None, None)
+    in_axes = (H.in_axes, None, None, None, None, None, None, None)
     out_axes = FloquetResult.out_axes()
 
     # cartesian batching only
-    nvmap = (H.ndim - 2, 0, 0, 0, 0, 0, 0)
+    nvmap = (H.ndim - 2, 0, 0, 0, 0, 0, 0, 0)
     f = cartesian_vmap(_floquet, in_axes, out_axes, nvmap)
 
-    return f(H, T, tsave, method, gradient, options)
+    return f(H, y0, T, tsave, integrator_constructor, method, gradient, options)
 
 
 def _floquet(
     H: TimeQArray,
+    y0: QArray,
     T: float,
     tsave: Array,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient,
     options: Options,
 ) -> FloquetResult:
-    # === select integrator constructor
-    supported_methods = (Tsit5, Dopri5, Dopri8, Kvaerno3, Kvaerno5, Euler)
-    assert_method_supported(method, supported_methods)
-    integrator_constructor = floquet_integrator_constructor
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
-        y0=None,
+        y0=y0,
         H=H,
         method=method,
         gradient=gradient,
@@ -236,15 +249,17 @@ def _check_floquet_args(
     )
 
     # === check that the Hamiltonian is periodic with the supplied period
-    # attach the check to `tsave` instead of `H` to workaround `CallableTimeQArray` that
-    # do not have an underlying array to attach the check to
-    rtol, atol = 1e-5, 1e-8  # TODO: fix hard-coded tolerance for periodicity check
-    tsave = eqx.error_if(
-        tsave,
-        jnp.logical_not(
-            eqx.tree_equal(H(0.0), H(T), rtol=rtol, atol=atol, typematch=True)
-        ),
-        'The Hamiltonian H is not periodic with the supplied period T.',
-    )
+    # a constant Hamiltonian is trivially periodic, so we skip evaluating it twice
+    if not isinstance(H, ConstantTimeQArray):
+        # attach the check to `tsave` instead of `H` to workaround `CallableTimeQArray`
+        # that do not have an underlying array to attach the check to
+        rtol, atol = 1e-5, 1e-8  # TODO: fix hard-coded tolerance for periodicity check
+        tsave = eqx.error_if(
+            tsave,
+            jnp.logical_not(
+                eqx.tree_equal(H(0.0), H(T), rtol=rtol, atol=atol, typematch=True)
+            ),
+            'The Hamiltonian H is not periodic with the supplied period T.',
+        )
 
     return H, T, tsave
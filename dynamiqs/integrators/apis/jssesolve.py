@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from functools import partial
 
 import jax
@@ -19,10 +20,14 @@ from ...time_qarray import TimeQArray
 from .._utils import (
     assert_method_supported,
     astimeqarray,
+    broadcast_batch,
+    broadcast_batch_list,
     cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
+    stack_qarrays,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.event_integrator import (
     jssesolve_event_dopri5_integrator_constructor,
     jssesolve_event_dopri8_integrator_constructor,
@@ -234,7 +239,6 @@ def jssesolve(
     H = astimeqarray(H)
     Ls = [astimeqarray(L) for L in jump_ops]
     psi0 = asqarray(psi0)
-    tsave = jnp.asarray(tsave)
     keys = jnp.asarray(keys)
     if exp_ops is not None:
         exp_ops = [asqarray(E) for E in exp_ops] if len(exp_ops) > 0 else None
@@ -244,22 +248,58 @@ def jssesolve(
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'jssesolve')
 
+    # === select integrator constructor
+    supported_methods = (Event,)
+    assert_method_supported(method, supported_methods)
+    if isinstance(method, Event):
+        integrator_constructors = {
+            Euler: jssesolve_event_euler_integrator_constructor,
+            Dopri5: jssesolve_event_dopri5_integrator_constructor,
+            Dopri8: jssesolve_event_dopri8_integrator_constructor,
+            Tsit5: jssesolve_event_tsit5_integrator_constructor,
+            Kvaerno3: jssesolve_event_kvaerno3_integrator_constructor,
+            Kvaerno5: jssesolve_event_kvaerno5_integrator_constructor,
+        }
+        integrator_constructor = integrator_constructors[type(method.noclick_method)]
+    else:
+        # temporary until we implement other methods
+        raise NotImplementedError
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
+    # stack exp_ops into a single qarray of shape (nE, n, n)
+    if exp_ops is not None:
+        exp_ops = stack_qarrays(exp_ops)
+
     # we implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to JAX arrays
     return _vectorized_jssesolve(
-        H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options
+        H,
+        Ls,
+        psi0,
+        tsave,
+        keys,
+        exp_ops,
+        integrator_constructor,
+        method,
+        gradient,
+        options,
     )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('method', 'gradient', 'options'))
+@partial(
+    jax.jit, static_argnames=('integrator_constructor', 'method', 'gradient', 'options')
+)
 def _vectorized_jssesolve(
     H: TimeQArray,
     Ls: list[TimeQArray],
     psi0: QArray,
     tsave: Array,
     keys: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
@@ -268,30 +308,41 @@ def _vectorized_jssesolve(
 
     # === vectorize function over stochastic trajectories
     # the input is vectorized over `key`
-    in_axes = (None, None, None, None, 0, None, None, None, None)
+    in_axes = (None, None, None, None, 0, *(None,) * 5)
     # the result is vectorized over `_saved`, `infos` and `keys`
     out_axes = JSSESolveResult.out_axes()
     f = jax.vmap(f, in_axes, out_axes)
 
     # === vectorize function
     # vectorize input over H, Ls and psi0.
-    in_axes = (H.in_axes, [L.in_axes for L in Ls], 0, *(None,) * 6)
+    in_axes = (H.in_axes, [L.in_axes for L in Ls], 0, *(None,) * 7)
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], psi0.ndim - 2, 0, 0, 0, 0, 0, 0)
+        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], psi0.ndim - 2, *(0,) * 7)
         f = cartesian_vmap(f, in_axes, out_axes, nvmap)
     else:
         bshape = jnp.broadcast_shapes(*[x.shape[:-2] for x in [H, *Ls, psi0]])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        n = H.shape[-1]
-        H = H.broadcast_to(*bshape, n, n)
-        Ls = [L.broadcast_to(*bshape, n, n) for L in Ls]
-        psi0 = psi0.broadcast_to(*bshape, n, 1)
+        H, H_in_axes = broadcast_batch(H, in_axes[0], bshape)
+        Ls, Ls_in_axes = broadcast_batch_list(Ls, in_axes[1], bshape)
+        psi0, psi0_in_axes = broadcast_batch(psi0, in_axes[2], bshape)
+        in_axes = (H_in_axes, Ls_in_axes, psi0_in_axes, *in_axes[3:])
         # vectorize the function
         f = multi_vmap(f, in_axes, out_axes, nvmap)
 
-    return f(H, Ls, psi0, tsave, keys, exp_ops, method, gradient, options)
+    return f(
+        H,
+        Ls,
+        psi0,
+        tsave,
+        keys,
+        exp_ops,
+        integrator_constructor,
+        method,
+        gradient,
+        options,
+    )
 
 
 def _jssesolve_single_trajectory(
@@ -300,31 +351,12 @@ def _jssesolve_single_trajectory(
     psi0: QArray,
     tsave: Array,
     key: PRNGKeyArray,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> JSSESolveResult:
-    # === select integrator constructor
-    supported_methods = (Event,)
-    assert_method_supported(method, supported_methods)
-    if isinstance(method, Event):
-        integrator_constructors = {
-            Euler: jssesolve_event_euler_integrator_constructor,
-            Dopri5: jssesolve_event_dopri5_integrator_constructor,
-            Dopri8: jssesolve_event_dopri8_integrator_constructor,
-            Tsit5: jssesolve_event_tsit5_integrator_constructor,
-            Kvaerno3: jssesolve_event_kvaerno3_integrator_constructor,
-            Kvaerno5: jssesolve_event_kvaerno5_integrator_constructor,
-        }
-        integrator_constructor = integrator_constructors[type(method.noclick_method)]
-    else:
-        # temporary until we implement other methods
-        raise NotImplementedError
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Callable
 from functools import partial
 
 import jax
@@ -12,16 +13,19 @@ from ...gradient import Gradient
 from ...method import Expm, Method
 from ...options import Options, check_options
 from ...qarrays.dense_qarray import DenseQArray
-from ...qarrays.qarray import QArrayLike
+from ...qarrays.qarray import QArray, QArrayLike
 from ...result import MEPropagatorResult
 from ...time_qarray import TimeQArray
 from .._utils import (
     assert_method_supported,
     astimeqarray,
+    broadcast_batch,
+    broadcast_batch_list,
     cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.expm_integrator import mepropagator_expm_integrator_constructor
 
 
@@ -163,69 +167,76 @@ def mepropagator(
     # === convert arguments
     H = astimeqarray(H)
     Ls = [astimeqarray(L) for L in jump_ops]
-    tsave = jnp.asarray(tsave)
 
     # === check arguments
     _check_mepropagator_args(H, Ls)
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'mepropagator')
 
+    # === select integrator constructor
+    integrator_constructors = {Expm: mepropagator_expm_integrator_constructor}
+    assert_method_supported(method, integrator_constructors.keys())
+    integrator_constructor = integrator_constructors[type(method)]
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
     # we implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to qarrays
-    return _vectorized_mepropagator(H, Ls, tsave, method, gradient, options)
+    return _vectorized_mepropagator(
+        H, Ls, tsave, integrator_constructor, method, gradient, options
+    )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('method', 'gradient', 'options'))
+@partial(
+    jax.jit, static_argnames=('integrator_constructor', 'method', 'gradient', 'options')
+)
 def _vectorized_mepropagator(
     H: TimeQArray,
     Ls: list[TimeQArray],
     tsave: Array,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> MEPropagatorResult:
+    # initial propagator, shared by all batched Hamiltonians and jump operators
+    # todo: replace with vectorized utils constructor for eye
+    data = jnp.eye(H.shape[-1] ** 2, dtype=H.dtype)
+    y0 = DenseQArray(H.dims, True, data)
+
     # vectorize input over H and Ls
-    in_axes = (H.in_axes, [L.in_axes for L in Ls], None, None, None, None)
+    in_axes = (H.in_axes, [L.in_axes for L in Ls], *(None,) * 6)
     out_axes = MEPropagatorResult.out_axes()
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], 0, 0, 0, 0)
+        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], *(0,) * 6)
         f = cartesian_vmap(_mepropagator, in_axes, out_axes, nvmap)
     else:
         bshape = jnp.broadcast_shapes(*[x.shape[:-2] for x in [H, *Ls]])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        n = H.shape[-1]
-        H = H.broadcast_to(*bshape, n, n)
-        Ls = [L.broadcast_to(*bshape, n, n) for L in Ls]
+        H, H_in_axes = broadcast_batch(H, in_axes[0], bshape)
+        Ls, Ls_in_axes = broadcast_batch_list(Ls, in_axes[1], bshape)
+        in_axes = (H_in_axes, Ls_in_axes, *in_axes[2:])
         # vectorize the function
         f = multi_vmap(_mepropagator, in_axes, out_axes, nvmap)
 
-    return f(H, Ls, tsave, method, gradient, options)
+    return f(H, Ls, y0, tsave, integrator_constructor, method, gradient, options)
 
 
 def _mepropagator(
     H: TimeQArray,
     Ls: list[TimeQArray],
+    y0: QArray,
     tsave: Array,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> MEPropagatorResult:
-    # === select integrator constructor
-    integrator_constructors = {Expm: mepropagator_expm_integrator_constructor}
-    assert_method_supported(method, integrator_constructors.keys())
-    integrator_constructor = integrator_constructors[type(method)]
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
-    # todo: replace with vectorized utils constructor for eye
-    data = jnp.eye(H.shape[-1] ** 2, dtype=H.dtype)
-    # todo: timeqarray should expose dims without having to call at specific time
-    y0 = DenseQArray(H(0.0).dims, True, data)
     integrator = integrator_constructor(
         ts=tsave,
         y0=y0,
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import warnings
+from collections.abc import Callable
 from functools import partial
 
 import jax
@@ -29,10 +30,14 @@ from ...time_qarray import TimeQArray
 from .._utils import (
     assert_method_supported,
     astimeqarray,
+    broadcast_batch,
+    broadcast_batch_list,
     cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
+    stack_qarrays,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.diffrax_integrator import (
     mesolve_dopri5_integrator_constructor,
     mesolve_dopri8_integrator_constructor,
@@ -215,7 +220,6 @@ def mesolve(
     H = astimeqarray(H)
     Ls = [astimeqarray(L) for L in jump_ops]
     rho0 = asqarray(rho0)
-    tsave = jnp.asarray(tsave)
     if exp_ops is not None:
         exp_ops = [asqarray(E) for E in exp_ops] if len(exp_ops) > 0 else None
 
@@ -224,46 +228,74 @@ def mesolve(
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'mesolve')
 
+    # === select integrator constructor
+    integrator_constructors = {
+        Euler: mesolve_euler_integrator_constructor,
+        Rouchon1: mesolve_rouchon1_integrator_constructor,
+        Dopri5: mesolve_dopri5_integrator_constructor,
+        Dopri8: mesolve_dopri8_integrator_constructor,
+        Tsit5: mesolve_tsit5_integrator_constructor,
+        Kvaerno3: mesolve_kvaerno3_integrator_constructor,
+        Kvaerno5: mesolve_kvaerno5_integrator_constructor,
+        Expm: mesolve_expm_integrator_constructor,
+    }
+    assert_method_supported(method, integrator_constructors.keys())
+    integrator_constructor = integrator_constructors[type(method)]
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
+    # stack exp_ops into a single qarray of shape (nE, n, n)
+    if exp_ops is not None:
+        exp_ops = stack_qarrays(exp_ops)
+
     # === convert rho0 to density matrix
     rho0 = rho0.todm()
     rho0 = check_hermitian(rho0, 'rho0')
 
     # we implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to qarrays
-    return _vectorized_mesolve(H, Ls, rho0, tsave, exp_ops, method, gradient, options)
+    return _vectorized_mesolve(
+        H, Ls, rho0, tsave, exp_ops, integrator_constructor, method, gradient, options
+    )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('method', 'gradient', 'options'))
+@partial(
+    jax.jit, static_argnames=('integrator_constructor', 'method', 'gradient', 'options')
+)
 def _vectorized_mesolve(
     H: TimeQArray,
     Ls: list[TimeQArray],
     rho0: QArray,
     tsave: Array,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> MESolveResult:
     # vectorize input over H, Ls and rho0
-    in_axes = (H.in_axes, [L.in_axes for L in Ls], 0, None, None, None, None, None)
+    in_axes = (H.in_axes, [L.in_axes for L in Ls], 0, *(None,) * 6)
     out_axes = MESolveResult.out_axes()
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], rho0.ndim - 2, 0, 0, 0, 0, 0)
+        nvmap = (H.ndim - 2, [L.ndim - 2 for L in Ls], rho0.ndim - 2, *(0,) * 6)
         f = cartesian_vmap(_mesolve, in_axes, out_axes, nvmap)
     else:
         bshape = jnp.broadcast_shapes(*[x.shape[:-2] for x in [H, *Ls, rho0]])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        n = H.shape[-1]
-        H = H.broadcast_to(*bshape, n, n)
-        Ls = [L.broadcast_to(*bshape, n, n) for L in Ls]
-        rho0 = rho0.broadcast_to(*bshape, n, n)
+        H, H_in_axes = broadcast_batch(H, in_axes[0], bshape)
+        Ls, Ls_in_axes = broadcast_batch_list(Ls, in_axes[1], bshape)
+        rho0, rho0_in_axes = broadcast_batch(rho0, in_axes[2], bshape)
+        in_axes = (H_in_axes, Ls_in_axes, rho0_in_axes, *in_axes[3:])
         # vectorize the function
         f = multi_vmap(_mesolve, in_axes, out_axes, nvmap)
 
-    return f(H, Ls, rho0, tsave, exp_ops, method, gradient, options)
+    return f(
+        H, Ls, rho0, tsave, exp_ops, integrator_constructor, method, gradient, options
+    )
 
 
 def _mesolve(
@@ -271,28 +303,12 @@ def _mesolve(
     Ls: list[TimeQArray],
     rho0: QArray,
     tsave: Array,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> MESolveResult:
-    # === select integrator constructor
-    integrator_constructors = {
-        Euler: mesolve_euler_integrator_constructor,
-        Rouchon1: mesolve_rouchon1_integrator_constructor,
-        Dopri5: mesolve_dopri5_integrator_constructor,
-        Dopri8: mesolve_dopri8_integrator_constructor,
-        Tsit5: mesolve_tsit5_integrator_constructor,
-        Kvaerno3: mesolve_kvaerno3_integrator_constructor,
-        Kvaerno5: mesolve_kvaerno5_integrator_constructor,
-        Expm: mesolve_expm_integrator_constructor,
-    }
-    assert_method_supported(method, integrator_constructors.keys())
-    integrator_constructor = integrator_constructors[type(method)]
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
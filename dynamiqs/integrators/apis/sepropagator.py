@@ -1,9 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from functools import partial
 
 import jax
-import jax.numpy as jnp
 from jaxtyping import Array, ArrayLike
 
 from ..._checks import check_shape, check_times
@@ -11,7 +11,7 @@ from ...gradient import Gradient
 from ...method import Dopri5, Dopri8, Euler, Expm, Kvaerno3, Kvaerno5, Method, Tsit5
 from ...options import Options, check_options
 from ...qarrays.layout import dense
-from ...qarrays.qarray import QArrayLike
+from ...qarrays.qarray import QArray, QArrayLike
 from ...result import SEPropagatorResult
 from ...time_qarray import TimeQArray
 from ...utils.operators import eye
@@ -22,6 +22,7 @@ from .._utils import (
     catch_xla_runtime_error,
     ispwc,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.diffrax_integrator import (
     sepropagator_dopri5_integrator_constructor,
     sepropagator_dopri8_integrator_constructor,
@@ -155,49 +156,56 @@ def sepropagator(
     """
     # === convert arguments
     H = astimeqarray(H)
-    tsave = jnp.asarray(tsave)
 
     # === check arguments
     _check_sepropagator_args(H)
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'sepropagator')
 
+    # === select integrator constructor
+    if method is None:  # default method
+        method = Expm() if ispwc(H) else Tsit5()
+    integrator_constructor = _sepropagator_integrator_constructor(method)
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
     # we implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to qarrays
-    return _vectorized_sepropagator(H, tsave, method, gradient, options)
+    return _vectorized_sepropagator(
+        H, tsave, integrator_constructor, method, gradient, options
+    )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('method', 'gradient', 'options'))
+@partial(
+    jax.jit, static_argnames=('integrator_constructor', 'method', 'gradient', 'options')
+)
 def _vectorized_sepropagator(
     H: TimeQArray,
     tsave: Array,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> SEPropagatorResult:
+    # initial propagator, shared by all batched Hamiltonians
+    y0 = eye(*H.dims, layout=dense)
+
     # vectorize input over H
-    in_axes = (H.in_axes, None, None, None, None)
+    in_axes = (H.in_axes, None, None, None, None, None, None)
     out_axes = SEPropagatorResult.out_axes()
 
     # cartesian batching only
-    nvmap = (H.ndim - 2, 0, 0, 0, 0, 0)
+    nvmap = (H.ndim - 2, 0, 0, 0, 0, 0, 0)
     f = cartesian_vmap(_sepropagator, in_axes, out_axes, nvmap)
 
-    return f(H, tsave, method, gradient, options)
-
+    return f(H, y0, tsave, integrator_constructor, method, gradient, options)
 
-def _sepropagator(
-    H: TimeQArray,
-    tsave: Array,
-    method: Method | None,
-    gradient: Gradient | None,
-    options: Options,
-) -> SEPropagatorResult:
-    # === select integrator constructor
-    if method is None:  # default method
-        method = Expm() if ispwc(H) else Tsit5()
 
+def _sepropagator_integrator_constructor(
+    method: Method,
+) -> Callable[..., AbstractIntegrator]:
     integrator_constructors = {
         Expm: sepropagator_expm_integrator_constructor,
         Euler: sepropagator_euler_integrator_constructor,
@@ -208,13 +216,19 @@ def _sepropagator(
         Kvaerno5: sepropagator_kvaerno5_integrator_constructor,
     }
     assert_method_supported(method, integrator_constructors.keys())
-    integrator_constructor = integrator_constructors[type(method)]
+    return integrator_constructors[type(method)]
 
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
 
+def _sepropagator(
+    H: TimeQArray,
+    y0: QArray,
+    tsave: Array,
+    integrator_constructor: Callable[..., AbstractIntegrator],
+    method: Method,
+    gradient: Gradient | None,
+    options: Options,
+) -> SEPropagatorResult:
     # === init integrator
-    y0 = eye(*H.dims, layout=dense)
     integrator = integrator_constructor(
         ts=tsave,
         y0=y0,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from functools import partial
 
 import jax
@@ -18,10 +19,13 @@ from ...time_qarray import TimeQArray
 from .._utils import (
     assert_method_supported,
     astimeqarray,
+    broadcast_batch,
     cartesian_vmap,
     catch_xla_runtime_error,
     multi_vmap,
+    stack_qarrays,
 )
+from ..core.abstract_integrator import AbstractIntegrator
 from ..core.diffrax_integrator import (
     sesolve_dopri5_integrator_constructor,
     sesolve_dopri8_integrator_constructor,
@@ -186,7 +190,6 @@ def sesolve(
     # === convert arguments
     H = astimeqarray(H)
     psi0 = asqarray(psi0)
-    tsave = jnp.asarray(tsave)
     if exp_ops is not None:
         exp_ops = [asqarray(E) for E in exp_ops] if len(exp_ops) > 0 else None
 
@@ -195,67 +198,77 @@ def sesolve(
     tsave = check_times(tsave, 'tsave')
     check_options(options, 'sesolve')
 
+    # === select integrator constructor
+    integrator_constructors = {
+        Euler: sesolve_euler_integrator_constructor,
+        Dopri5: sesolve_dopri5_integrator_constructor,
+        Dopri8: sesolve_dopri8_integrator_constructor,
+        Tsit5: sesolve_tsit5_integrator_constructor,
+        Kvaerno3: sesolve_kvaerno3_integrator_constructor,
+        Kvaerno5: sesolve_kvaerno5_integrator_constructor,
+        Expm: sesolve_expm_integrator_constructor,
+    }
+    assert_method_supported(method, integrator_constructors.keys())
+    integrator_constructor = integrator_constructors[type(method)]
+
+    # === check gradient is supported
+    method.assert_supports_gradient(gradient)
+
+    # stack exp_ops into a single qarray of shape (nE, n, n)
+    if exp_ops is not None:
+        exp_ops = stack_qarrays(exp_ops)
+
     # we implement the jitted vectorization in another function to pre-convert QuTiP
     # objects (which are not JIT-compatible) to qarrays
-    return _vectorized_sesolve(H, psi0, tsave, exp_ops, method, gradient, options)
+    return _vectorized_sesolve(
+        H, psi0, tsave, exp_ops, integrator_constructor, method, gradient, options
+    )
 
 
 @catch_xla_runtime_error
-@partial(jax.jit, static_argnames=('method', 'gradient', 'options'))
+@partial(
+    jax.jit, static_argnames=('integrator_constructor', 'method', 'gradient', 'options')
+)
 def _vectorized_sesolve(
     H: TimeQArray,
     psi0: QArray,
     tsave: Array,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> SESolveResult:
     # vectorize input over H and psi0
-    in_axes = (H.in_axes, 0, None, None, None, None, None)
+    in_axes = (H.in_axes, 0, None, None, None, None, None, None)
     out_axes = SESolveResult.out_axes()
 
     if options.cartesian_batching:
-        nvmap = (H.ndim - 2, psi0.ndim - 2, 0, 0, 0, 0, 0)
+        nvmap = (H.ndim - 2, psi0.ndim - 2, 0, 0, 0, 0, 0, 0)
         f = cartesian_vmap(_sesolve, in_axes, out_axes, nvmap)
     else:
-        n = H.shape[-1]
         bshape = jnp.broadcast_shapes(H.shape[:-2], psi0.shape[:-2])
         nvmap = len(bshape)
         # broadcast all vectorized input to same shape
-        H = H.broadcast_to(*bshape, n, n)
-        psi0 = psi0.broadcast_to(*bshape, n, 1)
+        H, H_in_axes = broadcast_batch(H, in_axes[0], bshape)
+        psi0, psi0_in_axes = broadcast_batch(psi0, in_axes[1], bshape)
+        in_axes = (H_in_axes, psi0_in_axes, *in_axes[2:])
         # vectorize the function
         f = multi_vmap(_sesolve, in_axes, out_axes, nvmap)
 
-    return f(H, psi0, tsave, exp_ops, method, gradient, options)
+    return f(H, psi0, tsave, exp_ops, integrator_constructor, method, gradient, options)
 
 
 def _sesolve(
     H: TimeQArray,
     psi0: QArray,
     tsave: Array,
-    exp_ops: list[QArray] | None,
+    exp_ops: QArray | None,
+    integrator_constructor: Callable[..., AbstractIntegrator],
     method: Method,
     gradient: Gradient | None,
     options: Options,
 ) -> SESolveResult:
-    # === select integrator constructor
-    integrator_constructors = {
-        Euler: sesolve_euler_integrator_constructor,
-        Dopri5: sesolve_dopri5_integrator_constructor,
-        Dopri8: sesolve_dopri8_integrator_constructor,
-        Tsit5: sesolve_tsit5_integrator_constructor,
-        Kvaerno3: sesolve_kvaerno3_integrator_constructor,
-        Kvaerno5: sesolve_kvaerno5_integrator_constructor,
-        Expm: sesolve_expm_integrator_constructor,
-    }
-    assert_method_supported(method, integrator_constructors.keys())
-    integrator_constructor = integrator_constructors[type(method)]
-
-    # === check gradient is supported
-    method.assert_supports_gradient(gradient)
-
     # === init integrator
     integrator = integrator_constructor(
         ts=tsave,
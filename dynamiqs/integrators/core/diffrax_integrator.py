@@ -12,6 +12,7 @@ from jaxtyping import PyTree, Scalar
 from ..._utils import obj_type_str
 from ...gradient import Autograd, CheckpointAutograd
 from ...result import Result
+from .._utils import isconstant, stack_qarrays
 from .abstract_integrator import BaseIntegrator
 from .interfaces import AbstractTimeInterface, MEInterface, SEInterface, SolveInterface
 from .save_mixin import AbstractSaveMixin, PropagatorSaveMixin, SolveSaveMixin
@@ -229,10 +230,31 @@ class MEDiffraxIntegrator(DiffraxIntegrator, MEInterface):
         # and is thus more efficient numerically with only a negligible numerical error
         # induced on the dynamics.
 
-        def vector_field(t, y, _):  # noqa: ANN001, ANN202
+        def operators(t):  # noqa: ANN001, ANN202
+            # return the non-hermitian hamiltonian, and the stacked jump operators and
+            # their adjoint (or None if there are no jump operators)
             L, H = self.L(t), self.H(t)
-            Hnh = -1j * H + sum([-0.5 * _L.dag() @ _L for _L in L])
-            tmp = Hnh @ y + sum([0.5 * _L @ y @ _L.dag() for _L in L])
+            if len(L) == 0:
+                return -1j * H, None, None
+
+            # stack the jump operators to apply them all at once with batched
+            # matmuls, which keeps the traced graph size independent of nLs
+            L = stack_qarrays(L)  # (nLs, n, n)
+            Ld = L.dag()  # (nLs, n, n)
+            Hnh = -1j * H - 0.5 * (Ld @ L).sum(0)
+            return Hnh, L, Ld
+
+        # for a constant Hamiltonian and constant jump operators, the operators are
+        # computed once outside of the integration loop
+        if all(isconstant(x) for x in [self.H, *self.Ls]):
+            operators_t0 = operators(self.t0)
+            operators = lambda _: operators_t0
+
+        def vector_field(t, y, _):  # noqa: ANN001, ANN202
+            Hnh, L, Ld = operators(t)
+            tmp = Hnh @ y
+            if L is not None:
+                tmp += 0.5 * (L @ y @ Ld).sum(0)
             return tmp + tmp.dag()
 
         return dx.ODETerm(vector_field)
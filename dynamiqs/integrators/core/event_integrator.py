@@ -14,6 +14,7 @@ from ...qarrays.qarray import QArray
 from ...qarrays.utils import stack
 from ...result import Result
 from ...utils.general import dag, expect, norm, unit
+from .._utils import isconstant, stack_qarrays
 from .abstract_integrator import StochasticBaseIntegrator
 from .diffrax_integrator import DiffraxIntegrator
 from .interfaces import JSSEInterface, SolveInterface
@@ -55,9 +56,34 @@ class JSSESolveEventIntegrator(
 
     @property
     def terms(self) -> dx.AbstractTerm:
-        def vector_field(t, y, _):  # noqa: ANN001, ANN202
+        def operators(t):  # noqa: ANN001, ANN202
+            # return the non-hermitian hamiltonian Hnh, and the stacked jump operators
+            # whose contribution -0.5 sum_k Ld_k @ L_k is not yet included in Hnh (or
+            # None if there are none)
             L, H = self.L(t), self.H(t)
-            return -1j * H @ y + sum([-0.5 * _L.dag() @ (_L @ y) for _L in L])
+            if len(L) == 0:
+                return -1j * H, None
+
+            # stack the jump operators to apply them all at once with batched matmuls,
+            # which keeps the traced graph size independent of nLs
+            return -1j * H, stack_qarrays(L)  # (nLs, n, n)
+
+        # for a constant Hamiltonian and constant jump operators, the full
+        # non-hermitian hamiltonian is computed once outside of the integration loop
+        if all(isconstant(x) for x in [self.H, *self.Ls]):
+            Hnh, L = operators(self.t0)
+            if L is not None:
+                Hnh = Hnh - 0.5 * (L.dag() @ L).sum(0)
+            operators = lambda _: (Hnh, None)
+
+        def vector_field(t, y, _):  # noqa: ANN001, ANN202
+            Hnh, L = operators(t)
+            dy = Hnh @ y
+            if L is not None:
+                # for time-dependent operators, sum_k Ld_k @ L_k is never formed to
+                # keep the cost of each step to matrix-vector products
+                dy = dy - 0.5 * (L.dag() @ (L @ y)).sum(0)
+            return dy
 
         return dx.ODETerm(vector_field)
 
@@ -8,13 +8,13 @@ import jax
 import jax.numpy as jnp
 import numpy as np
 from jax import Array
-from jaxtyping import ArrayLike, PRNGKeyArray, Scalar
+from jaxtyping import PRNGKeyArray, Scalar
 
 from ...qarrays.qarray import QArray
-from ...qarrays.utils import stack
 from ...result import Result
 from ...utils.general import dag, expect
 from ...utils.operators import eye_like
+from .._utils import isconstant, stack_qarrays
 from .abstract_integrator import StochasticBaseIntegrator
 from .interfaces import DSMEInterface, DSSEInterface, SolveInterface
 from .rouchon_integrator import cholesky_normalize
@@ -32,14 +32,14 @@ class DiffusiveState(eqx.Module):
 
 
 def _is_multiple_of(
-    x: ArrayLike, dt: float, *, rtol: float = 1e-5, atol: float = 1e-5
+    x: np.ndarray, dt: float, *, rtol: float = 1e-5, atol: float = 1e-5
 ) -> bool:
-    x_rounded = np.round(np.array(x) / dt) * dt
+    x_rounded = np.round(x / dt) * dt
     return np.allclose(x, x_rounded, rtol=rtol, atol=atol)
 
 
 def _is_linearly_spaced(
-    x: ArrayLike, *, rtol: float = 1e-5, atol: float = 1e-5
+    x: np.ndarray, *, rtol: float = 1e-5, atol: float = 1e-5
 ) -> bool:
     diffs = np.diff(x)
     return np.allclose(diffs, diffs[0], rtol=rtol, atol=atol)
@@ -51,15 +51,18 @@ class DiffusiveSolveIntegrator(
     """Integrator solving the diffusive SSE/SME with a fixed step size integrator."""
 
     def __check_init__(self):
+        # convert the (static) save times to NumPy once for all checks
+        ts = np.asarray(self.ts)
+
         # check that all tsave values are exact multiples of dt
-        if not _is_multiple_of(self.ts, self.dt):
+        if not _is_multiple_of(ts, self.dt):
             raise ValueError(
                 'Argument `tsave` should only contain exact multiples of the method '
                 'fixed step size `dt`.'
             )
 
         # check that tsave is linearly spaced
-        if not _is_linearly_spaced(self.ts):
+        if not _is_linearly_spaced(ts):
             raise ValueError('Argument `tsave` should be linearly spaced.')
 
         # check that options.t0 is not used
@@ -91,7 +94,12 @@ class DiffusiveSolveIntegrator(
         return self.method.dt
 
     def integrate(
-        self, t0: float, y0: DiffusiveState, key: PRNGKeyArray, nsteps: int
+        self,
+        forward: callable[[Scalar, DiffusiveState, Array], DiffusiveState],
+        t0: float,
+        y0: DiffusiveState,
+        key: PRNGKeyArray,
+        nsteps: int,
     ) -> tuple[float, DiffusiveState]:
         # integrate the SDE for nsteps of length dt
         # sample wiener
@@ -100,7 +108,7 @@ class DiffusiveSolveIntegrator(
         # iterate over the fixed step size dt
         def step(carry, dW):  # noqa: ANN001, ANN202
             t, y = carry
-            y = self.forward(t, y, dW)
+            y = forward(t, y, dW)
             t = t + self.dt
             return (t, y), None
 
@@ -109,7 +117,12 @@ class DiffusiveSolveIntegrator(
         return t, y
 
     def integrate_by_chunks(
-        self, t0: float, y0: DiffusiveState, key: PRNGKeyArray, nsteps: int
+        self,
+        forward: callable[[Scalar, DiffusiveState, Array], DiffusiveState],
+        t0: float,
+        y0: DiffusiveState,
+        key: PRNGKeyArray,
+        nsteps: int,
     ) -> tuple[float, DiffusiveState]:
         # integrate the SSE/SME for nsteps of length dt, splitting the integration in
         # chunks of 1000 dts to ensure a fixed memory usage
@@ -120,7 +133,7 @@ class DiffusiveSolveIntegrator(
         # iterate over each chunk
         def step(carry, key):  # noqa: ANN001, ANN202
             t, y = carry
-            t, y = self.integrate(t, y, key, nsteps_per_chunk)
+            t, y = self.integrate(forward, t, y, key, nsteps_per_chunk)
             return (t, y), None
 
         # split the key for each chunk
@@ -130,7 +143,7 @@ class DiffusiveSolveIntegrator(
 
         # integrate for the remaining number of steps (< nsubsteps)
         nremaining = nsteps % nsteps_per_chunk
-        t, y = self.integrate(t, y, lastkey, nremaining)
+        t, y = self.integrate(forward, t, y, lastkey, nremaining)
 
         return t, y
 
@@ -155,10 +168,13 @@ class DiffusiveSolveIntegrator(
         saved0 = self.save(y0)
 
         # === run the simulation
+        # get the step function once, outside of the integration loop
+        forward = self.forward_fn
+
         # integrate the SSE/SME for each save interval
         def outer_step(carry, key):  # noqa: ANN001, ANN202
             t, y = carry
-            t, y = self.integrate_by_chunks(t, y, key, nsteps_per_save)
+            t, y = self.integrate_by_chunks(forward, t, y, key, nsteps_per_save)
             return (t, y), self.save(y)
 
         # split the key for each save interval
@@ -187,6 +203,12 @@ class DiffusiveSolveIntegrator(
         # return (state_{t+dt}, dY_{t+dt})
         pass
 
+    @property
+    def forward_fn(self) -> callable[[Scalar, DiffusiveState, Array], DiffusiveState]:
+        # return the function computing a single step, can be overridden to compute
+        # time-independent quantities once outside of the integration loop
+        return self.forward
+
 
 class DSSEFixedStepIntegrator(DiffusiveSolveIntegrator, DSSEInterface):
     @property
@@ -199,8 +221,8 @@ class DSSESolveEulerMayuramaIntegrator(DSSEFixedStepIntegrator):
 
     def forward(self, t: Scalar, y: DiffusiveState, dW: Array) -> DiffusiveState:
         psi = y.state
-        L, H = self.L(t), self.H(t)
-        Lpsi = [_L @ psi for _L in L]
+        L, H = stack_qarrays(self.L(t)), self.H(t)  # (nL, n, n)
+        Lpsi = L @ psi  # (nL, n, 1)
 
         # === measurement Y
         # dY = <L+Ld> dt + dW
@@ -209,28 +231,15 @@ class DSSESolveEulerMayuramaIntegrator(DSSEFixedStepIntegrator):
         #          = psi.dag() @ (L + Ld) @ psi
         #          = psi.dag() @ L @ psi + (psi.dag() @ L @ psi).dag()
         #          = 2 Re[psi.dag() @ Lpsi]
-        exp = jnp.stack(
-            [2 * (psi.dag() @ _Lpsi).squeeze((-1, -2)).real for _Lpsi in Lpsi]
-        )  # (nL)
+        exp = 2 * (psi.dag() @ Lpsi).squeeze((-1, -2)).real  # (nL)
         dY = exp * self.dt + dW
 
         # === state psi
+        exp, dW = exp[:, None, None], dW[:, None, None]  # (nL, 1, 1)
         dpsi = (
             -1j * self.dt * H @ psi
-            - 0.5
-            * self.dt
-            * sum(
-                [
-                    _L.dag() @ _Lpsi - _exp * _Lpsi + 0.25 * _exp**2 * psi
-                    for _L, _Lpsi, _exp in zip(L, Lpsi, exp, strict=True)
-                ]
-            )
-            + sum(
-                [
-                    (_Lpsi - 0.5 * _exp * psi) * _dW
-                    for _L, _Lpsi, _exp, _dW in zip(L, Lpsi, exp, dW, strict=True)
-                ]
-            )
+            - 0.5 * self.dt * (L.dag() @ Lpsi - exp * Lpsi + 0.25 * exp**2 * psi).sum(0)
+            + ((Lpsi - 0.5 * exp * psi) * dW).sum(0)
         )
 
         return DiffusiveState(psi + dpsi, y.Y + dY)
@@ -258,16 +267,18 @@ class DSMESolveEulerMayuramaIntegrator(DSMEFixedStepIntegrator):
 
         rho = y.state
         L, Lm, H = self.L(t), self.Lm(t), self.H(t)
-        LdL = sum([_L.dag() @ _L for _L in L])
+        L, Lm = stack_qarrays(L), stack_qarrays(Lm)  # (nL, n, n), (nLm, n, n)
+        Ld = L.dag()  # (nL, n, n)
+        LdL = (Ld @ L).sum(0)
 
         # === Lcal(rho)
         # (see MEDiffraxIntegrator in `integrators/core/diffrax_integrator.py`)
         Hnh = -1j * H - 0.5 * LdL
-        tmp = Hnh @ rho + sum([0.5 * _L @ rho @ _L.dag() for _L in L])
+        tmp = Hnh @ rho + 0.5 * (L @ rho @ Ld).sum(0)
         Lcal_rho = tmp + tmp.dag()
 
         # === Ccal(rho)
-        Lm_rho = stack([_Lm @ rho for _Lm in Lm])
+        Lm_rho = Lm @ rho  # (nLm, n, n)
         etas = self.etas[:, None, None]  # (nLm, 1, 1)
         Ccal_rho = jnp.sqrt(etas) * (Lm_rho + Lm_rho.dag())  # (nLm, n, n)
         tr_Ccal_rho = Ccal_rho.trace().real  # (nLm,)
@@ -297,34 +308,68 @@ class DSMESolveRouchon1Integrator(DSMEFixedStepIntegrator, SolveInterface):
         # See comment of `cholesky_normalize()` for the normalisation (computed for the
         # "average" Kraus operators M0 = I - (iH + 0.5 Ld @ L) dt and M1 = L sqrt(dt)).
 
-        rho = y.state
+        return self._kraus_map(self.operators(t), y, dW)
+
+    @property
+    def forward_fn(self) -> callable[[Scalar, DiffusiveState, Array], DiffusiveState]:
+        # for a constant Hamiltonian and constant jump operators, the operators are
+        # computed once outside of the integration loop
+        operators = self.operators
+        if all(isconstant(x) for x in [self.H, *self.Ls]):
+            operators_t0 = operators(self.t0)
+            operators = lambda _: operators_t0
+
+        return lambda t, y, dW: self._kraus_map(operators(t), y, dW)
+
+    def operators(self, t: Scalar) -> tuple[QArray, QArray, QArray, QArray | None]:
+        # return the "average" no-jump Kraus operator M0, the sum LdL = sum_k Ld_k @
+        # L_k, the stacked measured jump operators and the stacked Kraus operators of
+        # the unmonitored jump operators (or None if there are none)
         L, Lc, Lm, H = self.L(t), self.Lc(t), self.Lm(t), self.H(t)
-        I = eye_like(H)
-        LdL = sum([_L.dag() @ _L for _L in L])
+
+        # stack the jump operators to apply them all at once with batched matmuls
+        L, Lm = stack_qarrays(L), stack_qarrays(Lm)  # (nL, n, n), (nLm, n, n)
+        LdL = (L.dag() @ L).sum(0)
+
+        # M0 is either the exact exponential e^{-(iH + 0.5 LdL) dt} or its first order
+        # approximation
+        if self.method.exact_expm:
+            # the exponential is dense, so the operators are converted explicitly to
+            # avoid conversion warnings for sparse operators
+            M0 = (-(1j * H + 0.5 * LdL) * self.dt).asdense().expm()
+            Lm = Lm.asdense()
+        else:
+            M0 = eye_like(H, layout=H.layout) - (1j * H + 0.5 * LdL) * self.dt
+
+        Mc = self.dt * stack_qarrays(Lc) if len(Lc) > 0 else None  # (nLc, n, n)
+        return M0, LdL, Lm, Mc
+
+    def _kraus_map(
+        self,
+        operators: tuple[QArray, QArray, QArray, QArray | None],
+        y: DiffusiveState,
+        dW: Array,
+    ) -> DiffusiveState:
+        rho = y.state
+        M0, LdL, Lm, Mc = operators
+        sqrt_etas = jnp.sqrt(self.etas)[:, None, None]  # (nLm, 1, 1)
 
         # === measurement Y
         # dY_{k+1} = sqrt(eta) Tr[(L+Ld) @ rho_k)] dt + dW
-        trace = jnp.stack([expect(_Lm + _Lm.dag(), rho).real for _Lm in Lm])  # (nLm)
+        trace = expect(Lm + Lm.dag(), rho).real  # (nLm)
         dY = jnp.sqrt(self.etas) * trace * self.dt + dW  # (nLm,)
 
         # === state rho
-        M0 = I - (1j * H + 0.5 * LdL) * self.dt
-        M_dY = M0 + sum(
-            [
-                jnp.sqrt(eta) * _dY * _Lm
-                for eta, _dY, _Lm in zip(self.etas, dY, Lm, strict=True)
-            ]
-        )
-        Ms = [
-            jnp.sqrt((1 - eta) * self.dt) * _Lm
-            for eta, _Lm in zip(self.etas, Lm, strict=True)
-        ] + [self.dt * _Lc for _Lc in Lc]
+        M_dY = M0 + (sqrt_etas * dY[:, None, None] * Lm).sum(0)
+        Ms = jnp.sqrt((1 - self.etas) * self.dt)[:, None, None] * Lm  # (nLm, n, n)
 
         if self.method.normalize:
             rho = cholesky_normalize(M0, LdL, self.dt, rho)
 
-        rho = M_dY @ rho @ dag(M_dY) + sum([_M @ rho @ dag(_M) for _M in Ms])
-        rho = rho / rho.trace()  # normalise by signal probability
+        rho_next = M_dY @ rho @ dag(M_dY) + (Ms @ rho @ Ms.dag()).sum(0)
+        if Mc is not None:
+            rho_next += (Mc @ rho @ Mc.dag()).sum(0)
+        rho = rho_next / rho_next.trace()  # normalise by signal probability
 
         return DiffusiveState(rho, y.Y + dY)
 
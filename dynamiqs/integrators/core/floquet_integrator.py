@@ -7,7 +7,7 @@ from jaxtyping import PyTree
 from dynamiqs.result import FloquetSaved
 
 from ...result import Result, Saved
-from ..apis.sepropagator import _sepropagator
+from ..apis.sepropagator import _sepropagator, _sepropagator_integrator_constructor
 from .abstract_integrator import BaseIntegrator
 from .interfaces import SEInterface
 
@@ -29,7 +29,13 @@ class SEFloquetIntegrator(FloquetIntegrator, SEInterface):
         # compute propagators for all times at once, with the last being one period
         ts = jnp.append(self.ts, self.t0 + self.T)
         seprop_result = _sepropagator(
-            self.H, ts, method=self.method, gradient=self.gradient, options=options
+            self.H,
+            self.y0,
+            ts,
+            integrator_constructor=_sepropagator_integrator_constructor(self.method),
+            method=self.method,
+            gradient=self.gradient,
+            options=options,
         )
 
         # diagonalize the final propagator to get the Floquet modes at t=t0
@@ -84,4 +84,4 @@ class DSMEInterface(AbstractTimeInterface):
 
 
 class SolveInterface(eqx.Module):
-    Es: list[QArray] | None
+    Es: QArray | None
@@ -12,6 +12,7 @@ from diffrax._local_interpolation import LocalLinearInterpolation
 from ...qarrays.qarray import QArray
 from ...utils.general import dag
 from ...utils.operators import eye_like
+from .._utils import isconstant, stack_qarrays
 from .diffrax_integrator import MESolveDiffraxIntegrator
 
 
@@ -76,10 +77,13 @@ def cholesky_normalize(M0: QArray, LdL: QArray, dt: float, rho: QArray) -> jax.A
     # In practice we directly replace rho_k by Td^{-1} @ rho_k @ T^{-1/2}
     # instead of computing all ~Mks.
 
-    # dt may be a traced array, so we need to be careful with the sum
-    S = M0.dag() @ M0 + (LdL * dt if LdL != 0.0 else 0.0)
+    # dt may be a traced array, so we need to be careful with the sum, which is done
+    # on the dense arrays to support mixed layouts between M0 and LdL
+    S = (M0.dag() @ M0).to_jax()
+    if LdL != 0.0:
+        S = S + (LdL * dt).to_jax()
 
-    T = jnp.linalg.cholesky(S.to_jax())  # T lower triangular
+    T = jnp.linalg.cholesky(S)  # T lower triangular
 
     # we want Td^{-1} @ y0 @ T^{-1}
     rho = rho.to_jax()
@@ -98,6 +102,27 @@ class MESolveRouchon1Integrator(MESolveDiffraxIntegrator):
 
     @property
     def terms(self) -> dx.AbstractTerm:
+        def operators(t):  # noqa: ANN202
+            # return the non-hermitian hamiltonian Hnh such that M0 = I + Hnh dt, the
+            # sum LdL = sum_k Ld_k @ L_k, and the stacked jump operators and their
+            # adjoint (or None if there are no jump operators)
+            L, H = self.L(t), self.H(t)
+            if len(L) == 0:
+                return -1j * H, 0, None, None
+
+            # stack the jump operators to apply them all at once with batched matmuls,
+            # the adjoint is computed once for LdL and the jump term
+            L = stack_qarrays(L)  # (nLs, n, n)
+            Ld = L.dag()  # (nLs, n, n)
+            LdL = (Ld @ L).sum(0)
+            return -1j * H - 0.5 * LdL, LdL, L, Ld
+
+        # for a constant Hamiltonian and constant jump operators, the operators are
+        # computed once outside of the integration loop
+        if all(isconstant(x) for x in [self.H, *self.Ls]):
+            operators_t0 = operators(self.t0)
+            operators = lambda _: operators_t0
+
         def kraus_map(t0, t1, y0):  # noqa: ANN202
             # The Rouchon update for a single loss channel is:
             #   rho_{k+1} = M0 @ rho_k @ M0d + M1 @ rho_k @ M1d
@@ -109,17 +134,35 @@ class MESolveRouchon1Integrator(MESolveDiffraxIntegrator):
 
             delta_t = t1 - t0
             rho = y0
-            L, H = self.L(t0), self.H(t0)
-            I = eye_like(H)
-            LdL = sum([_L.dag() @ _L for _L in L])
+            Hnh, LdL, L, Ld = operators(t0)
 
-            M0 = I - (1j * H + 0.5 * LdL) * delta_t
-            Ms = [jnp.sqrt(delta_t) * _L for _L in L]
+            # M0 = e^{Hnh dt} is computed exactly if required, otherwise M0 = I + Hnh dt
+            # is only materialized when required by the normalization
+            if self.method.exact_expm:
+                # the exponential is dense, Hnh is converted explicitly to avoid a
+                # conversion warning for sparse operators
+                M0 = (Hnh * delta_t).asdense().expm()
+            elif self.method.normalize:
+                M0 = eye_like(Hnh, layout=Hnh.layout) + Hnh * delta_t
 
             if self.method.normalize:
                 rho = cholesky_normalize(M0, LdL, delta_t, rho)
 
-            return M0 @ rho @ dag(M0) + sum([_M @ rho @ dag(_M) for _M in Ms])
+            # the jump term sum_k M_k @ rho @ M_kd with M_k = L_k sqrt(dt) is computed
+            # as dt * sum_k L_k @ rho @ L_kd
+            jump = (L @ rho @ Ld).sum(0) * delta_t if L is not None else 0
+
+            if self.method.exact_expm:
+                return M0 @ rho @ M0.dag() + jump
+
+            # M0 @ rho @ M0d is expanded as
+            #   rho + (Hnh @ rho + rho @ Hnhd) dt + Hnh @ rho @ Hnhd dt^2
+            # to avoid the two matmuls by the identity-dominated M0, where we use that
+            # rho is hermitian to write rho @ Hnhd = (Hnh @ rho)d
+            tmp = Hnh @ rho
+            return (
+                (tmp + dag(tmp)) * delta_t + (tmp @ dag(Hnh)) * delta_t**2 + rho + jump
+            )
 
         return AbstractRouchonTerm(kraus_map)
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 from abc import abstractmethod
 
 import equinox as eqx
-import jax.numpy as jnp
 from jaxtyping import Array, PyTree
 
 from ...result import (
@@ -53,10 +52,7 @@ class SolveSaveMixin(AbstractSaveMixin):
     def save(self, y: PyTree) -> Saved:
         ysave = y if self.options.save_states else None
         extra = self.options.save_extra(y) if self.options.save_extra else None
-        if self.Es is not None:
-            Esave = jnp.stack([expect(E, y) for E in self.Es])
-        else:
-            Esave = None
+        Esave = expect(self.Es, y) if self.Es is not None else None
         return SolveSaved(ysave, extra, Esave)
 
     def reorder_Esave(self, saved: Saved) -> Saved:
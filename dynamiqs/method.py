@@ -172,6 +172,11 @@ class Rouchon1(_DEFixedStep):
         normalize: If True, the scheme is trace-preserving to machine precision, which
             is the recommended option because it is much more stable. Otherwise, it is
             only trace-preserving to first order in $\dt$.
+        exact_expm: If True, the no-jump Kraus operator is computed with the exact
+            matrix exponential $M_0 = e^{-iH_\mathrm{nh}\dt}$ of the non-hermitian
+            Hamiltonian, which is more accurate for stiff problems at the cost of one
+            matrix exponential per step. Otherwise, it is computed to first order in
+            $\dt$ as $M_0 = I - iH_\mathrm{nh}\dt$.
 
     Note-: Supported gradients
         This method supports differentiation with
@@ -182,11 +187,13 @@ class Rouchon1(_DEFixedStep):
 
     SUPPORTED_GRADIENT: ClassVar[_TupleGradient] = (Autograd, CheckpointAutograd)
     normalize: bool
+    exact_expm: bool
 
     # dummy init to have the signature in the documentation
-    def __init__(self, dt: float, normalize: bool = True):
+    def __init__(self, dt: float, normalize: bool = True, exact_expm: bool = False):
         super().__init__(dt)
         self.normalize = normalize
+        self.exact_expm = exact_expm
 
     # normalize: The default scheme is trace-preserving at first order only. This
     # parameter sets the normalisation behaviour:
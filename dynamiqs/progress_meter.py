@@ -72,7 +72,7 @@ class _DiffraxTqdmProgressMeter(dx.TqdmProgressMeter):
             '|{bar}| {percentage:5.1f}% ◆ elapsed {elapsed_custom} '
             '◆ remaining {remaining_custom}'
         )
-        return _TqdmCustom(total=100, unit='%', bar_format=bar_format)
+        return _TqdmCustom(total=100, unit='%', bar_format=bar_format, mininterval=0.5)
 
 
 class TqdmProgressMeter(AbstractProgressMeter):
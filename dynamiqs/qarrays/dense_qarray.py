@@ -156,7 +156,7 @@ class DenseQArray(QArray):
         return self._replace(data=data)
 
     def __add__(self, y: QArrayLike) -> QArray:
-        if isinstance(y, int | float) and y == 0:
+        if isinstance(y, int | float | complex) and y == 0:
             return self
 
         super().__add__(y)
@@ -241,11 +241,14 @@ def array_to_qobj_list(x: Array, dims: tuple[int, ...]) -> Qobj | list[Qobj]:
     elif x.shape[-1] == x.shape[-2]:  # [[3], [3]] or [[3, 4], [3, 4]]
         dims = [dims, dims]
 
-    return jax.tree.map(
-        lambda x: Qobj(x, dims=dims),
-        x.tolist(),
-        is_leaf=lambda x: jnp.asarray(x).ndim == 2,
-    )
+    # transfer the whole array to host once, then build the (nested) list of Qobjs
+    # from NumPy slices
+    def to_qobj_list(x: np.ndarray) -> Qobj | list:
+        if x.ndim == 2:
+            return Qobj(x, dims=dims)
+        return [to_qobj_list(sub_x) for sub_x in x]
+
+    return to_qobj_list(np.asarray(x))
 
 
 @partial(jnp.vectorize, signature='(a,b),(c,d)->(ac,bd)')
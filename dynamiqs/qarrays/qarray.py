@@ -76,13 +76,17 @@ def to_jax(x: QArrayLike) -> Array:
                [[ 1.+0.j,  0.+0.j],
                 [ 0.+0.j, -1.+0.j]]], dtype=complex64)
     """
-    if isinstance(x, QArray):
+    if isinstance(x, Array):
+        # JAX arrays are returned as is
+        return x
+    elif isinstance(x, QArray):
         return x.to_jax()
     elif isinstance(x, Qobj):
         return jnp.asarray(x.full())
-    elif isinstance(x, Sequence):
+    elif isinstance(x, Sequence) and _contains_qarray_or_qobj(x):
         return jnp.asarray([to_jax(sub_x) for sub_x in x])
     else:
+        # nested sequences of numeric types and arrays are converted in a single call
         return jnp.asarray(x)
 
 
@@ -127,12 +131,22 @@ def to_numpy(x: QArrayLike) -> np.ndarray:
         return x.to_numpy()
     elif isinstance(x, Qobj):
         return np.asarray(x.full())
-    elif isinstance(x, Sequence):
+    elif isinstance(x, Sequence) and _contains_qarray_or_qobj(x):
         return np.asarray([to_numpy(sub_x) for sub_x in x])
     else:
         return np.asarray(x)
 
 
+def _contains_qarray_or_qobj(x: Sequence) -> bool:
+    # return True if the nested sequence `x` contains a qarray or a qobj, which must be
+    # converted element by element
+    return any(
+        isinstance(sub_x, QArray | Qobj)
+        or (isinstance(sub_x, Sequence) and _contains_qarray_or_qobj(sub_x))
+        for sub_x in x
+    )
+
+
 class QArray(eqx.Module):
     r"""Dynamiqs custom array to represent quantum objects.
 
@@ -1,7 +1,7 @@
-from collections import defaultdict
 from collections.abc import Sequence
 from functools import partial, reduce
 
+import jax
 import jax.numpy as jnp
 import numpy as np
 from jax._src.core import concrete_or_error
@@ -15,6 +15,21 @@ def _sparsedia_slice(offset: int) -> slice:
     return slice(offset, None) if offset >= 0 else slice(None, offset)
 
 
+def _sparsedia_indices(
+    offsets: tuple[int, ...], n: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Return the row and column indices in the full matrix of each stored element of
+    # the diagonals, along with a mask of the elements which are not padding, all of
+    # shape (ndiags, n). A diagonal with offset k stores the element at row j - k and
+    # column j at index j, for example with n = 3 the diagonal with offset 1 is stored
+    # as [0, a, b] with a at (0, 1) and b at (1, 2). The row indices of padding elements
+    # are clipped to remain valid indices.
+    cols = np.broadcast_to(np.arange(n), (len(offsets), n))
+    rows = cols - np.asarray(offsets, dtype=int).reshape(-1, 1)
+    valid = (rows >= 0) & (rows < n)
+    return rows.clip(0, n - 1), cols, valid
+
+
 def transpose_sparsedia(
     offsets: tuple[int, ...], diags: Array
 ) -> tuple[tuple[int, ...], Array]:
@@ -82,16 +97,8 @@ def mul_sparsedia_sparsedia(
         left_offsets, right_offsets, assume_unique=True, return_indices=True
     )
 
-    # initialize the output diagonals
-    batch_shape = jnp.broadcast_shapes(left_diags.shape[:-2], right_diags.shape[:-2])
-    out_shape = (*batch_shape, len(out_offsets), left_diags.shape[-1])
-    dtype = jnp.promote_types(left_diags.dtype, right_diags.dtype)
-    out_diags = jnp.zeros(out_shape, dtype=dtype)
-
-    # loop over each output offset and fill the output
-    for i in range(len(out_offsets)):
-        out_diag = left_diags[..., left_ind[i], :] * right_diags[..., right_ind[i], :]
-        out_diags = out_diags.at[..., i, :].set(out_diag)
+    # multiply the matching diagonals of both inputs at once
+    out_diags = left_diags[..., left_ind, :] * right_diags[..., right_ind, :]
 
     return _numpy_to_tuple(out_offsets), out_diags
 
@@ -104,27 +111,18 @@ def _numpy_to_tuple(x: np.ndarray) -> tuple:
 def mul_sparsedia_array(
     offsets: tuple[int, ...], diags: Array, array: Array
 ) -> tuple[tuple[int, ...], Array]:
-    # initialize the output diagonals
-    batch_shape = jnp.broadcast_shapes(diags.shape[:-2], array.shape[:-2])
-    out_shape = (*batch_shape, len(offsets), diags.shape[-1])
-    dtype = jnp.promote_types(diags.dtype, array.dtype)
-    out_diags = jnp.zeros(out_shape, dtype=dtype)
-
-    # loop over each diagonal of the sparse matrix and fill the output
-    for i, offset in enumerate(offsets):
-        in_slice = _sparsedia_slice(offset)
-        other_diag = jnp.diagonal(array, offset=offset, axis1=-2, axis2=-1)
-        out_diag = other_diag * diags[..., i, in_slice]
-        out_diags = out_diags.at[..., i, in_slice].set(out_diag)
-
+    # gather the elements of the array on all diagonals at once
+    rows, cols, valid = _sparsedia_indices(offsets, diags.shape[-1])
+    out_diags = jnp.where(valid, diags * array[..., rows, cols], 0)
     return offsets, out_diags
 
 
+@partial(jax.jit, static_argnames=('offsets',))
 def sparsedia_to_array(offsets: tuple[int, ...], diags: Array) -> Array:
+    # scatter the non-padding elements of all diagonals at once
+    rows, cols, valid = _sparsedia_indices(offsets, diags.shape[-1])
     out = jnp.zeros(shape_sparsedia(diags), dtype=diags.dtype)
-    for i, offset in enumerate(offsets):
-        out += _vectorized_diag(diags[..., i, :], offset)
-    return out
+    return out.at[..., rows[valid], cols[valid]].add(diags[..., valid])
 
 
 def shape_sparsedia(diags: Array) -> tuple[int, ...]:
@@ -132,11 +130,6 @@ def shape_sparsedia(diags: Array) -> tuple[int, ...]:
     return (*diags.shape[:-2], n, n)
 
 
-@partial(jnp.vectorize, signature='(n)->(n,n)', excluded={1})
-def _vectorized_diag(diag: Array, offset: int) -> Array:
-    return jnp.diag(diag[_sparsedia_slice(offset)], k=offset)
-
-
 def array_to_sparsedia(x: Array) -> tuple[tuple[int, ...], Array]:
     concrete_or_error(None, x, '`array_to_sparsedia` does not support tracing.')
     offsets = _find_offsets(x)
@@ -150,14 +143,9 @@ def _find_offsets(x: Array) -> tuple[int, ...]:
 
 
 def _construct_diags(offsets: tuple[int, ...], x: Array) -> Array:
-    n = x.shape[-1]
-    diags = jnp.zeros((*x.shape[:-2], len(offsets), n), dtype=x.dtype)
-
-    for i, offset in enumerate(offsets):
-        diag = jnp.diagonal(x, offset=offset, axis1=-2, axis2=-1)
-        diags = diags.at[..., i, _sparsedia_slice(offset)].set(diag)
-
-    return diags
+    # gather all diagonals at once and zero the padding elements
+    rows, cols, valid = _sparsedia_indices(offsets, x.shape[-1])
+    return jnp.where(valid, x[..., rows, cols], 0)
 
 
 def add_sparsedia_sparsedia(
@@ -166,6 +154,10 @@ def add_sparsedia_sparsedia(
     right_offsets: tuple[int, ...],
     right_diags: Array,
 ) -> tuple[tuple[int, ...], Array]:
+    # fast path when both inputs share the same offsets
+    if left_offsets == right_offsets:
+        return left_offsets, left_diags + right_diags
+
     # compute the output offsets
     out_offsets = np.union1d(left_offsets, right_offsets).astype(int)
 
@@ -175,14 +167,11 @@ def add_sparsedia_sparsedia(
     dtype = jnp.promote_types(left_diags.dtype, right_diags.dtype)
     out_diags = jnp.zeros(diags_shape, dtype=dtype)
 
-    # loop over each offset and fill the output
-    for i, offset in enumerate(out_offsets):
-        if offset in left_offsets:
-            left_diag = left_diags[..., left_offsets.index(offset), :]
-            out_diags = out_diags.at[..., i, :].add(left_diag)
-        if offset in right_offsets:
-            right_diag = right_diags[..., right_offsets.index(offset), :]
-            out_diags = out_diags.at[..., i, :].add(right_diag)
+    # add each input at the position of its offsets in the output
+    left_ind = np.searchsorted(out_offsets, np.asarray(left_offsets, dtype=int))
+    right_ind = np.searchsorted(out_offsets, np.asarray(right_offsets, dtype=int))
+    out_diags = out_diags.at[..., left_ind, :].add(left_diags)
+    out_diags = out_diags.at[..., right_ind, :].add(right_diags)
 
     return _numpy_to_tuple(out_offsets), out_diags
 
@@ -196,8 +185,23 @@ def matmul_sparsedia_sparsedia(
     n = left_diags.shape[-1]
     batch_shape = jnp.broadcast_shapes(left_diags.shape[:-2], right_diags.shape[:-2])
     dtype = jnp.promote_types(left_diags.dtype, right_diags.dtype)
-    diag_dict = defaultdict(lambda: jnp.zeros((*batch_shape, n), dtype=dtype))
 
+    # compute the output offsets, discarding those outside of the matrix (the result
+    # is a zero matrix with no diagonal if all are discarded)
+    out_offsets = tuple(
+        sorted(
+            {
+                loffset + roffset
+                for loffset in left_offsets
+                for roffset in right_offsets
+                if abs(loffset + roffset) <= n - 1
+            }
+        )
+    )
+    offset_to_index = {offset: idx for idx, offset in enumerate(out_offsets)}
+
+    # initialize the output diagonals and accumulate each product of diagonals
+    out_diags = jnp.zeros((*batch_shape, len(out_offsets), n), dtype=dtype)
     for i, loffset in enumerate(left_offsets):
         for j, roffset in enumerate(right_offsets):
             out_offset = loffset + roffset
@@ -208,18 +212,13 @@ def matmul_sparsedia_sparsedia(
             lslice = _sparsedia_slice(-roffset)
             rslice = _sparsedia_slice(roffset)
             diag = left_diags[..., i, lslice] * right_diags[..., j, rslice]
-            diag_dict[out_offset] = diag_dict[out_offset].at[..., rslice].add(diag)
+            idx = offset_to_index[out_offset]
+            out_diags = out_diags.at[..., idx, rslice].add(diag)
 
-    out_offsets = tuple(sorted(diag_dict.keys()))
-    if len(out_offsets) == 0:
-        # edge case where the result is a zero matrix
-        out_diags = jnp.zeros((*batch_shape, 0, n), dtype=dtype)
-    else:
-        out_diags = jnp.stack([diag_dict[offset] for offset in out_offsets])
-        out_diags = jnp.moveaxis(out_diags, 0, -2)
     return out_offsets, out_diags
 
 
+@partial(jax.jit, static_argnames=('offsets',))
 def matmul_sparsedia_array(
     offsets: tuple[int, ...], diags: Array, array: Array
 ) -> Array:
@@ -236,6 +235,7 @@ def matmul_sparsedia_array(
     return out
 
 
+@partial(jax.jit, static_argnames=('offsets',))
 def matmul_array_sparsedia(
     array: Array, offsets: tuple[int, ...], diags: Array
 ) -> Array:
@@ -282,11 +282,9 @@ def _compress_sparsedia(
     diags_shape = (*diags.shape[:-2], len(out_offsets), diags.shape[-1])
     out_diags = jnp.zeros(diags_shape, dtype=diags.dtype)
 
-    # loop over each offset and fill the output
-    for i in range(len(out_offsets)):
-        mask = inverse_ind == i
-        diag = jnp.sum(diags[..., mask, :], axis=-2)
-        out_diags = out_diags.at[..., i, :].set(diag)
+    # sum diagonals with identical offsets in a single scatter, duplicate indices are
+    # accumulated
+    out_diags = out_diags.at[..., inverse_ind.ravel(), :].add(diags)
 
     return _numpy_to_tuple(out_offsets), out_diags
 
@@ -297,35 +295,36 @@ def stack_sparsedia(
     axis: int,
 ) -> tuple[tuple[int, ...], Array]:
     # compute unique offsets of the output
-    out_offsets = np.asarray(reduce(np.union1d, offsets_sequence))
-    offset_to_index = {offset: idx for idx, offset in enumerate(out_offsets)}
+    out_offsets = np.asarray(reduce(np.union1d, offsets_sequence)).astype(int)
 
-    # prepare output diagonals with the correct shape and dtype
+    # prepare output diagonals with the correct shape and dtype, the stack axis is
+    # placed just before the diagonals axis and moved at the end
     dtype = reduce(jnp.promote_types, [diags.dtype for diags in diags_sequence])
     in_shape = diags_sequence[0].shape
-    out_shape = (len(diags_sequence), *in_shape[:-2], len(out_offsets), in_shape[-1])
+    out_shape = (*in_shape[:-2], len(diags_sequence), len(out_offsets), in_shape[-1])
     out_diags = jnp.zeros(out_shape, dtype=dtype)
+
+    # set all diagonals of each element at the position of its offsets in the output
     for i, (offsets, diags) in enumerate(
         zip(offsets_sequence, diags_sequence, strict=True)
     ):
-        for j, offset in enumerate(offsets):
-            idx = offset_to_index[offset]
-            out_diags = out_diags.at[i, ..., idx, :].add(diags[..., j, :])
+        idx = np.searchsorted(out_offsets, np.asarray(offsets, dtype=int))
+        out_diags = out_diags.at[..., i, idx, :].add(diags)
 
     # move the stack axis to the correct position
-    out_diags = jnp.moveaxis(out_diags, 0, axis)
+    out_diags = jnp.moveaxis(out_diags, -3, axis)
     return _numpy_to_tuple(out_offsets), out_diags
 
 
 def autopad_sparsedia_diags(
     offsets: tuple[int, ...], diags: Sequence[Array]
 ) -> tuple[Array]:
-    # stack diags in a square matrix by padding each according to its offset
-    pads_width = [(abs(k), 0) if k >= 0 else (0, abs(k)) for k in offsets]
-    diags = [
-        jnp.pad(diag, pad_width)
-        for pad_width, diag in zip(pads_width, diags, strict=True)
-    ]
+    # stack diags in a square matrix by padding each according to its offset, the
+    # output is allocated once and each diagonal is set at its offset slice
+    n = diags[0].shape[-1] + abs(offsets[0])
+    batch_shape = jnp.broadcast_shapes(*[diag.shape[:-1] for diag in diags])
     dtype = reduce(jnp.promote_types, [diag.dtype for diag in diags])
-    diags = jnp.stack(diags, dtype=dtype)
-    return jnp.moveaxis(diags, 0, -2)
+    out_diags = jnp.zeros((*batch_shape, len(offsets), n), dtype=dtype)
+    for i, (offset, diag) in enumerate(zip(offsets, diags, strict=True)):
+        out_diags = out_diags.at[..., i, _sparsedia_slice(offset)].set(diag)
+    return out_diags
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import warnings
 from collections.abc import Sequence
+from math import prod
 
 import jax.numpy as jnp
-import numpy as np
 from jaxtyping import ArrayLike, DTypeLike
 from qutip import Qobj
 
@@ -296,7 +296,7 @@ def sparsedia_from_dict(
 
 def _assert_dims_match_shape(dims: tuple[int, ...], shape: tuple[int, ...]):
     # check that `dims` and `shape` are compatible
-    if np.prod(dims) != np.max(shape[-2:]):
+    if prod(dims) != max(shape[-2:]):
         raise ValueError(
             f'Argument `dims={dims}` is incompatible with the input shape'
             f' `shape={shape}`.'
@@ -102,7 +102,6 @@ def pwc(times: ArrayLike, values: ArrayLike, qarray: QArrayLike) -> PWCTimeQArra
          [   ⋅     2.+0.j]]
     """
     # times
-    times = jnp.asarray(times)
     times = check_times(times, 'times')
 
     # values
@@ -0,0 +1,88 @@
+import jax
+import jax.numpy as jnp
+import pytest
+
+import dynamiqs as dq
+from dynamiqs.qarrays.layout import Layout
+
+from ..order import TEST_SHORT
+
+
+def _dsmesolve(
+    method: dq.method.Method, dephasing: float = 0.5, layout: Layout | None = None
+) -> dq.DSMESolveResult:
+    # solver inputs, with two monitored and one unmonitored (eta = 0) jump operators
+    n = 4
+    a = dq.destroy(n, layout=layout)
+    H = a.dag() @ a + 0.2 * (a + a.dag())
+    jump_ops = [a, dephasing * a.dag() @ a, 0.3 * a.dag()]
+    etas = [0.8, 0.0, 0.5]
+    rho0 = dq.coherent_dm(n, 0.5)
+    tsave = jnp.linspace(0.0, 0.1, 3)
+    keys = jax.random.split(jax.random.key(42), 2)
+    exp_ops = [a.dag() @ a]
+
+    return dq.dsmesolve(
+        H, jump_ops, etas, rho0, tsave, keys, exp_ops=exp_ops, method=method
+    )
+
+
+@pytest.mark.run(order=TEST_SHORT)
+def test_euler_maruyama_fixed_key():
+    result = _dsmesolve(dq.method.EulerMaruyama(dt=1e-2))
+
+    # compare against reference trajectories
+    expects = [[[0.249915, 0.257656, 0.291626]], [[0.249915, 0.202734, 0.272607]]]
+    measurements = [
+        [[5.384257, 0.383106], [1.750052, 4.324582]],
+        [[5.070353, 3.053999], [-3.738790, 7.964395]],
+    ]
+    assert jnp.allclose(result.expects.real, jnp.array(expects), atol=1e-4)
+    assert jnp.allclose(result.measurements, jnp.array(measurements), atol=1e-3)
+
+
+@pytest.mark.run(order=TEST_SHORT)
+@pytest.mark.parametrize(
+    ('normalize', 'expects', 'measurements'),
+    [
+        (
+            True,
+            [[[0.249915, 0.141558, 0.111345]], [[0.249915, 0.109445, 0.107704]]],
+            [
+                [[5.280015, 0.091261], [1.725329, 4.255364]],
+                [[4.969353, 2.785391], [-3.762744, 7.900689]],
+            ],
+        ),
+        (
+            False,
+            [[[0.249915, 0.145137, 0.114858]], [[0.249915, 0.112308, 0.111344]]],
+            [
+                [[5.284393, 0.100979], [1.726367, 4.257670]],
+                [[4.974727, 2.795255], [-3.761470, 7.903029]],
+            ],
+        ),
+    ],
+)
+def test_rouchon1_fixed_key(normalize, expects, measurements):
+    # strong unmonitored dephasing such that its Kraus term is resolved by the test
+    method = dq.method.Rouchon1(dt=1e-2, normalize=normalize)
+    result = _dsmesolve(method, dephasing=3.0)
+
+    # compare against reference trajectories
+    assert jnp.allclose(result.expects.real, jnp.array(expects), atol=1e-4)
+    assert jnp.allclose(result.measurements, jnp.array(measurements), atol=1e-3)
+
+
+@pytest.mark.run(order=TEST_SHORT)
+@pytest.mark.filterwarnings('error')
+@pytest.mark.parametrize('layout', [dq.dense, dq.dia])
+@pytest.mark.parametrize('normalize', [True, False])
+def test_rouchon1_exact_expm(layout, normalize):
+    # at small dt, the exact exponential matches its first order approximation
+    method = dq.method.Rouchon1(dt=1e-3, normalize=normalize)
+    result = _dsmesolve(method, layout=layout)
+    method = dq.method.Rouchon1(dt=1e-3, normalize=normalize, exact_expm=True)
+    result_expm = _dsmesolve(method, layout=layout)
+
+    assert jnp.allclose(result.expects, result_expm.expects, atol=1e-3)
+    assert jnp.allclose(result.measurements, result_expm.measurements, atol=1e-2)
@@ -0,0 +1,35 @@
+import jax
+import jax.numpy as jnp
+import pytest
+
+import dynamiqs as dq
+
+from ..order import TEST_SHORT
+
+
+@pytest.mark.run(order=TEST_SHORT)
+def test_euler_maruyama_fixed_key():
+    # solver inputs
+    n = 4
+    a = dq.destroy(n)
+    H = a.dag() @ a + 0.2 * (a + a.dag())
+    jump_ops = [a, 0.5 * a.dag() @ a]
+    psi0 = dq.coherent(n, 0.5)
+    tsave = jnp.linspace(0.0, 0.1, 3)
+    keys = jax.random.split(jax.random.key(42), 2)
+    exp_ops = [a.dag() @ a]
+    method = dq.method.EulerMaruyama(dt=1e-2)
+
+    # solve with dssesolve
+    result = dq.dssesolve(
+        H, jump_ops, psi0, tsave, keys, exp_ops=exp_ops, method=method
+    )
+
+    # compare against reference trajectories
+    expects = [[[0.249915, 0.249895, 0.283602]], [[0.249915, 0.190901, 0.259232]]]
+    measurements = [
+        [[5.477087, 0.479032], [1.772349, 4.359457]],
+        [[5.165339, 3.134339], [-3.714615, 7.974711]],
+    ]
+    assert jnp.allclose(result.expects.real, jnp.array(expects), atol=1e-4)
+    assert jnp.allclose(result.measurements, jnp.array(measurements), atol=1e-3)
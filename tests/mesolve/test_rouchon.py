@@ -12,8 +12,9 @@ from .open_system import dense_ocavity, dia_ocavity, otdqubit
 class TestMESolveRouchon1(IntegratorTester):
     @pytest.mark.parametrize('system', [dense_ocavity, dia_ocavity, otdqubit])
     @pytest.mark.parametrize('normalize', [True, False])
-    def test_correctness(self, system, normalize):
-        method = Rouchon1(dt=1e-4, normalize=normalize)
+    @pytest.mark.parametrize('exact_expm', [False, True])
+    def test_correctness(self, system, normalize, exact_expm):
+        method = Rouchon1(dt=1e-4, normalize=normalize, exact_expm=exact_expm)
         self._test_correctness(system, method, esave_atol=1e-3)
 
     @pytest.mark.parametrize('system', [dense_ocavity, dia_ocavity, otdqubit])
@@ -107,6 +107,10 @@ class TestSparseDIAQArray:
         with pytest.raises(NotImplementedError):
             sA + self.bscalar
 
+        # check addition with a null scalar returns the sparse qarray as is
+        assert sA + 0 is sA
+        assert sA + 0j is sA
+
     @pytest.mark.parametrize('kA', ['simple', 'batch', 'batch_broadcast'])
     def test_scalaradd(self, kA):
         d, s = self.denseA[kA], self.sparseA[kA]